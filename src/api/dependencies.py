@@ -1,7 +1,7 @@
 from typing import Generator, Annotated
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from src.utils.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.utils.database import get_db, async_session_factory
 from src.services.car_service import CarService
 
 
@@ -9,5 +9,12 @@ async def get_car_service(db: AsyncSession = Depends(get_db)) -> CarService:
     return CarService()
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """The factory routes use to open extra sessions (e.g. for concurrent
+    queries). Resolved as a dependency so tests can override it."""
+    return async_session_factory
+
+
 CarServiceDep = Annotated[CarService, Depends(get_car_service)]
-DBSession = Annotated[AsyncSession, Depends(get_db)]
\ No newline at end of file
+DBSession = Annotated[AsyncSession, Depends(get_db)]
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
\ No newline at end of file
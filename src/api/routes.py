@@ -1,7 +1,10 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Path, status, Body
+from fastapi.responses import Response
 from datetime import date, timedelta, datetime
 from typing import List, Optional, Dict, Any
-from src.api.dependencies import DBSession, CarServiceDep
+from pydantic import TypeAdapter
+from src.api.dependencies import DBSession, CarServiceDep, SessionFactory
 from src.api.schemas import (
     CarResponse, CarCreate, CarUpdate, CarListResponse,
     Statistics, MakeResponse, ModelResponse, SearchParams, ErrorResponse
@@ -13,6 +16,21 @@ import logging
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Pre-built adapter so car lists serialize in one native pydantic-core
+# call instead of per-item validation through FastAPI
+CAR_LIST_ADAPTER = TypeAdapter(List[CarResponse])
+
+
+def car_list_response(cars) -> Response:
+    """Serialize a list of cars to a JSON response via the shared adapter"""
+    return Response(
+        content=CAR_LIST_ADAPTER.dump_json(
+            CAR_LIST_ADAPTER.validate_python(cars, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
+
+
 router = APIRouter()
 
 @router.get("/cars", status_code=status.HTTP_200_OK)
@@ -34,29 +52,33 @@ async def get_cars(
     if brand:
         limit = 9999  # Set a very high limit to effectively get all records
     
-    cars = await car_service.get_cars(db, skip=skip, limit=limit, 
-                                     brand=brand, model=model, year=year, 
-                                     min_price=min_price, max_price=max_price,
-                                     min_mileage=min_mileage, max_mileage=max_mileage)
-    
-    # Manually convert SQLAlchemy models to dictionaries
-    result = []
-    for car in cars:
-        car_dict = {
-            "id": car.id,
-            "brand": car.brand,
-            "model": car.model,
-            "year": car.year,
-            "mileage": car.mileage,
-            "sale_date": car.sale_date.isoformat() if car.sale_date else None,
-            "kvd_id": car.kvd_id,
-            "url": car.url,
-            "price": car.price,
-            "created_at": car.created_at.isoformat() if car.created_at else None
-        }
-        result.append(car_dict)
-    
-    return result
+    # Dates are serialized to ISO strings by Postgres (to_char), so the
+    # rows can be returned as-is without per-row isoformat() calls
+    return await car_service.get_cars_serialized(
+        db, skip=skip, limit=limit,
+        brand=brand, model=model, year=year,
+        min_price=min_price, max_price=max_price,
+        min_mileage=min_mileage, max_mileage=max_mileage)
+
+@router.post("/cars", response_model=CarResponse, status_code=status.HTTP_201_CREATED)
+async def create_car(
+    car: CarCreate,
+    db: DBSession = None,
+    car_service: CarServiceDep = None,
+):
+    """Create a single car"""
+    return await car_service.create_car(db, car)
+
+# Registered before /cars/{car_id} so "batch" is not parsed as an id
+@router.post("/cars/batch", status_code=status.HTTP_201_CREATED)
+async def create_cars_batch(
+    cars: List[CarCreate],
+    db: DBSession = None,
+    car_service: CarServiceDep = None,
+):
+    """Create many cars in one request and a single transaction"""
+    count = await car_service.bulk_create_cars(db, [car.model_dump() for car in cars])
+    return {"created": count}
 
 @router.get("/cars/{car_id}", response_model=CarResponse, status_code=status.HTTP_200_OK)
 async def get_car(
@@ -73,18 +95,59 @@ async def get_car(
         )
     return car
 
+@router.patch("/cars/{car_id}", response_model=CarResponse, status_code=status.HTTP_200_OK)
+async def update_car(
+    car_update: CarUpdate,
+    car_id: int = Path(..., ge=1),
+    db: DBSession = None,
+    car_service: CarServiceDep = None,
+):
+    """Update an existing car"""
+    car = await car_service.update_car(db, car_id, car_update)
+    if not car:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Car not found"
+        )
+    return car
+
+@router.delete("/cars/{car_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_car(
+    car_id: int = Path(..., ge=1),
+    db: DBSession = None,
+    car_service: CarServiceDep = None,
+):
+    """Delete a car by ID"""
+    car = await car_service.delete_car(db, car_id)
+    if not car:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Car not found"
+        )
+
 @router.get("/makes", response_model=List[MakeResponse], status_code=status.HTTP_200_OK)
 async def get_makes(
     db: DBSession = None,
     car_service: CarServiceDep = None,
+    session_factory: SessionFactory = None,
 ):
     """Get all car makes/brands"""
     makes = await car_service.get_all_makes(db)
-    result = []
-    for make in makes:
-        models = await car_service.get_models_by_make(db, make)
-        result.append(MakeResponse(name=make, model_count=len(models)))
-    return result
+
+    # Fetch the model list for each make concurrently; each task gets its
+    # own session since AsyncSession is not safe for concurrent use. The
+    # factory comes in as a dependency so test overrides can point it at
+    # the test database.
+    async def fetch_model_count(make: str) -> int:
+        async with session_factory() as session:
+            models = await car_service.get_models_by_make(session, make)
+            return len(models)
+
+    model_counts = await asyncio.gather(*(fetch_model_count(make) for make in makes))
+    return [
+        MakeResponse(name=make, model_count=count)
+        for make, count in zip(makes, model_counts)
+    ]
 
 @router.get("/makes/{make}/models", response_model=List[ModelResponse], status_code=status.HTTP_200_OK)
 async def get_models_by_make(
@@ -100,7 +163,7 @@ async def get_models_by_make(
         result.append(ModelResponse(name=model, auction_count=len(cars)))
     return result
 
-@router.get("/models/{make}/{model}/auctions", response_model=List[CarResponse], status_code=status.HTTP_200_OK)
+@router.get("/models/{make}/{model}/auctions", response_model=None, status_code=status.HTTP_200_OK)
 async def get_auctions_by_model(
     make: str = Path(..., min_length=1),
     model: str = Path(..., min_length=1),
@@ -111,7 +174,7 @@ async def get_auctions_by_model(
 ):
     """Get all auctions for a specific make/model"""
     cars = await car_service.get_cars_by_make_and_model(db, make, model, skip, limit)
-    return cars
+    return car_list_response(cars)
 
 @router.get("/models/{make}/{model}/statistics", response_model=Statistics, status_code=status.HTTP_200_OK)
 async def get_model_statistics(
@@ -125,7 +188,7 @@ async def get_model_statistics(
     stats = await car_service.get_statistics(db, make, model)
     return stats
 
-@router.post("/search", response_model=List[CarResponse], status_code=status.HTTP_200_OK)
+@router.post("/search", response_model=None, status_code=status.HTTP_200_OK)
 async def search_cars(
     search_params: SearchParams,
     db: DBSession = None,
@@ -135,7 +198,7 @@ async def search_cars(
     cars = await car_service.search_cars(
         db, search_params.query, skip=search_params.skip, limit=search_params.limit
     )
-    return cars
+    return car_list_response(cars)
 
 @router.delete("/cars", status_code=status.HTTP_200_OK)
 async def delete_all_cars(
@@ -9,12 +9,12 @@ class Car(Base):
 
     id = Column(Integer, primary_key=True)
     kvd_id = Column(String(100), unique=True, nullable=False)
-    brand = Column(String(100), nullable=False)
-    model = Column(String(100), nullable=False)
+    brand = Column(String(100), nullable=False, index=True)
+    model = Column(String(100), nullable=False, index=True)
     year = Column(Integer, nullable=False)
     price = Column(Integer)
     mileage = Column(Integer, nullable=False)
-    sale_date = Column(Date, nullable=False)
+    sale_date = Column(Date, nullable=False, index=True)
     url = Column(String(500), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     raw_data = Column(JSON)
\ No newline at end of file
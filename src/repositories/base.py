@@ -49,8 +49,10 @@ class BaseRepository(Generic[ModelType]):
         await db.refresh(db_obj)
         return db_obj
 
-    async def remove(self, db: AsyncSession, *, id: int) -> ModelType:
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
         obj = await self.get(db, id)
+        if obj is None:
+            return None
         await db.delete(obj)
         await db.commit()
         return obj
\ No newline at end of file
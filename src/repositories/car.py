@@ -1,15 +1,58 @@
 from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, bindparam
+from sqlalchemy.orm import raiseload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.models.car import Car
 from src.repositories.base import BaseRepository
+from src.services.stats_numba import regression_slope
+from src.utils.config import settings
+
+
+# Filter conditions for get_filtered, keyed by parameter name. Each uses a
+# bindparam so the constructed statement only depends on WHICH filters are
+# present, never on their values, and can be memoized per combination.
+_FILTER_CONDITIONS = {
+    "brand": lambda: Car.brand == bindparam("brand"),
+    "model": lambda: Car.model == bindparam("model"),
+    "year": lambda: Car.year == bindparam("year"),
+    "min_price": lambda: Car.price >= bindparam("min_price"),
+    "max_price": lambda: Car.price <= bindparam("max_price"),
+    "min_mileage": lambda: Car.mileage >= bindparam("min_mileage"),
+    "max_mileage": lambda: Car.mileage <= bindparam("max_mileage"),
+}
+
+
+@lru_cache(maxsize=128)
+def _filtered_select(active_filters: frozenset):
+    """Build (once per filter combination) the filtered car select"""
+    query = select(Car)
+    for name in _FILTER_CONDITIONS:
+        if name in active_filters:
+            query = query.filter(_FILTER_CONDITIONS[name]())
+    return (
+        query.order_by(desc(Car.sale_date))
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
 
 
 class CarRepository(BaseRepository[Car]):
     def __init__(self):
         super().__init__(Car)
-    
+
+    @staticmethod
+    def _guard_lazy_loads(query):
+        """In debug mode, make any unintended lazy relationship load raise
+        so N+1 regressions are caught at dev time. Routes that need a
+        relationship must request it explicitly via selectinload()."""
+        if settings.DEBUG:
+            query = query.options(raiseload("*"))
+        return query
+
     async def get_by_kvd_id(self, db: AsyncSession, kvd_id: str) -> Optional[Car]:
         return await self.get_by_field(db, "kvd_id", kvd_id)
     
@@ -17,11 +60,13 @@ class CarRepository(BaseRepository[Car]):
         self, db: AsyncSession, brand: str, model: str, skip: int = 0, limit: int = 100
     ) -> List[Car]:
         result = await db.execute(
-            select(Car)
-            .filter(Car.brand == brand, Car.model == model)
-            .order_by(desc(Car.sale_date))
-            .offset(skip)
-            .limit(limit)
+            self._guard_lazy_loads(
+                select(Car)
+                .filter(Car.brand == brand, Car.model == model)
+                .order_by(desc(Car.sale_date))
+                .offset(skip)
+                .limit(limit)
+            )
         )
         return result.scalars().all()
     
@@ -50,11 +95,9 @@ class CarRepository(BaseRepository[Car]):
             .filter(Car.brand == brand, Car.model == model)
         )
         stats = result.mappings().first()
-        
-        # TODO: Implement price trend calculation
-        # This would typically involve time series analysis
-        price_trend = 0.0
-        
+
+        price_trend = await self._compute_price_trend(db, brand, model)
+
         if stats:
             return {
                 "count": stats["count"] or 0,
@@ -75,6 +118,42 @@ class CarRepository(BaseRepository[Car]):
             "price_trend": 0.0,
         }
     
+    async def bulk_create(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """Insert many cars with a single executemany statement and one commit"""
+        if not rows:
+            return 0
+        await db.execute(Car.__table__.insert(), rows)
+        await db.commit()
+        return len(rows)
+
+    async def bulk_upsert(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """Insert many cars, silently skipping rows whose kvd_id already
+        exists. One executemany statement and one commit for the batch."""
+        if not rows:
+            return 0
+        stmt = pg_insert(Car).on_conflict_do_nothing(index_elements=['kvd_id'])
+        await db.execute(stmt, rows)
+        await db.commit()
+        return len(rows)
+
+    async def _compute_price_trend(self, db: AsyncSession, brand: str, model: str) -> float:
+        """Compute the price trend (kr/day) as a regression slope over sale dates"""
+        result = await db.execute(
+            select(Car.sale_date, Car.price)
+            .filter(Car.brand == brand, Car.model == model, Car.price.isnot(None))
+            .order_by(Car.sale_date)
+        )
+        rows = result.all()
+        if len(rows) < 2:
+            return 0.0
+
+        # Convert once to numpy arrays: days since the first sale vs price
+        origin = rows[0][0].toordinal()
+        days = np.fromiter((row[0].toordinal() - origin for row in rows), dtype=np.float64, count=len(rows))
+        prices = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+
+        return float(regression_slope(days, prices))
+
     async def search(
         self, db: AsyncSession, search_term: str, skip: int = 0, limit: int = 100
     ) -> List[Car]:
@@ -88,16 +167,14 @@ class CarRepository(BaseRepository[Car]):
         )
         return result.scalars().all()
     
-    async def get_filtered(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100,
-        brand: Optional[str] = None, model: Optional[str] = None,
+    @staticmethod
+    def _apply_filters(
+        query, brand: Optional[str] = None, model: Optional[str] = None,
         year: Optional[int] = None, min_price: Optional[int] = None,
         max_price: Optional[int] = None, min_mileage: Optional[int] = None,
         max_mileage: Optional[int] = None
-    ) -> List[Car]:
-        query = select(Car)
-        
-        # Apply filters if provided
+    ):
+        """Apply the optional car filters to a select statement"""
         if brand:
             query = query.filter(Car.brand == brand)
         if model:
@@ -112,18 +189,82 @@ class CarRepository(BaseRepository[Car]):
             query = query.filter(Car.mileage >= min_mileage)
         if max_mileage is not None:
             query = query.filter(Car.mileage <= max_mileage)
-        
-        # Apply order by, offset and limit
+        return query
+
+    async def get_filtered(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100,
+        brand: Optional[str] = None, model: Optional[str] = None,
+        year: Optional[int] = None, min_price: Optional[int] = None,
+        max_price: Optional[int] = None, min_mileage: Optional[int] = None,
+        max_mileage: Optional[int] = None
+    ) -> List[Car]:
+        # Match the original truthiness semantics: brand/model/year are
+        # ignored when falsy, price/mileage bounds only when None
+        params = {
+            name: value
+            for name, value in (
+                ("brand", brand), ("model", model), ("year", year),
+            )
+            if value
+        }
+        params.update(
+            (name, value)
+            for name, value in (
+                ("min_price", min_price), ("max_price", max_price),
+                ("min_mileage", min_mileage), ("max_mileage", max_mileage),
+            )
+            if value is not None
+        )
+
+        query = self._guard_lazy_loads(_filtered_select(frozenset(params)))
+
+        result = await db.execute(query, {**params, "skip": skip, "limit": limit})
+        return result.scalars().all()
+
+    async def get_filtered_rows(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100,
+        brand: Optional[str] = None, model: Optional[str] = None,
+        year: Optional[int] = None, min_price: Optional[int] = None,
+        max_price: Optional[int] = None, min_mileage: Optional[int] = None,
+        max_mileage: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Like get_filtered, but returns plain dicts with the date columns
+        already serialized to ISO strings by Postgres (to_char), so no
+        per-row isoformat() calls are needed in Python."""
+        query = self._apply_filters(
+            select(
+                Car.id,
+                Car.brand,
+                Car.model,
+                Car.year,
+                Car.mileage,
+                func.to_char(Car.sale_date, "YYYY-MM-DD").label("sale_date"),
+                Car.kvd_id,
+                Car.url,
+                Car.price,
+                # Convert to UTC before formatting: to_char on a
+                # timestamptz renders in the session timezone, which would
+                # shift the value with server config; the fixed +00:00
+                # suffix keeps the string a valid aware ISO timestamp
+                func.to_char(
+                    func.timezone("UTC", Car.created_at),
+                    'YYYY-MM-DD"T"HH24:MI:SS"+00:00"',
+                ).label("created_at"),
+            ),
+            brand=brand, model=model, year=year,
+            min_price=min_price, max_price=max_price,
+            min_mileage=min_mileage, max_mileage=max_mileage
+        )
+
         query = query.order_by(desc(Car.sale_date)).offset(skip).limit(limit)
-        
+
         result = await db.execute(query)
-        return result.scalars().all()
+        return [dict(row) for row in result.mappings()]
     
     async def delete_all(self, db: AsyncSession) -> int:
-        result = await db.execute(select(func.count(Car.id)))
-        count = result.scalar() or 0
-        
-        await db.execute(Car.__table__.delete())
+        # A single DELETE; Postgres reports the affected-row count in the
+        # command tag, so no separate SELECT COUNT round-trip is needed
+        result = await db.execute(Car.__table__.delete())
         await db.commit()
-        
-        return count
\ No newline at end of file
+
+        return result.rowcount or 0
\ No newline at end of file
@@ -1,6 +1,7 @@
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Set
 import asyncio
 from selenium import webdriver
@@ -10,7 +11,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
-from bs4 import BeautifulSoup
+import csv
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy.ext import asyncio as sql_asyncio
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select
@@ -19,7 +22,104 @@ import re
 from src.utils.config import settings
 from src.models.car import Car
 from src.utils.database import engine
-from src.services.car_service import CarService
+from src.repositories.car import CarRepository
+
+
+# Status phrases checked against the raw page source. Plain substring
+# checks (CPython's C-level two-way search) beat both regex and any form
+# of HTML parsing for these fixed literals.
+_SOLD_TOKEN = "Såld"
+_RESERVATION_TOKEN = "Reservationspris uppnått"
+_FIXED_PRICE_TOKEN = "Bilen köptes via fast pris"
+
+# Patterns for pulling the detail fields straight out of fetched HTML,
+# mirroring the span texts the browser-based path looks for
+_MILEAGE_HTML_RE = re.compile(r">\s*(\d[\d\s\xa0]*)\s*(mil|km)\b")
+_PRICE_HTML_RE = re.compile(r">\s*(\d[\d\s\xa0]*)\s*kr\s*<")
+_YEAR_HTML_RE = re.compile(
+    r"Summary__SpecLabels[^>]*>\s*<span[^>]*>\s*<span[^>]*>\s*(\d{4})", re.S
+)
+
+# Patterns shared with the browser-based extraction path
+_MILEAGE_RE = re.compile(r'(\d[\d\s]*)\s*(mil|km)')
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Auction id prefixes that mark tire/wheel auctions we never track.
+# Compiled into one alternation so the check is a single DFA scan no
+# matter how many prefixes are listed, and case folding is free.
+_SKIP_RE = re.compile(
+    r"^(?:vinterhjul|losa-hjul|nokian-hakkapeliitta)",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=65536)
+def _parse_brand_model(kvd_id: str) -> tuple:
+    """Split a kvd_id into (brand, model).
+
+    Pure function of the id, so repeat ids (common when result pages
+    overlap between runs) hit the cache instead of re-splitting.
+    """
+    parts = kvd_id.split('-')
+
+    # Handle edge cases
+    if not parts:
+        return "unknown", "unknown"
+
+    # First part is the brand
+    brand = parts[0].lower()
+
+    # Check if the last part is numeric - if so, exclude it
+    if parts[-1].isdigit():
+        last_part_index = -2  # Exclude the last element (number)
+    else:
+        last_part_index = -1  # Include everything if the last part isn't numeric
+
+    # Everything in between first and last part is the model
+    # Convert hyphens to spaces in the model name
+    model_parts = parts[1:last_part_index + 1]
+    model = " ".join(model_parts)
+
+    return brand, model
+
+
+# How many auction detail pages to fetch concurrently
+_DETAIL_FETCH_CONCURRENCY = 16
+
+# How many buffered rows trigger a database flush
+_INSERT_BATCH_SIZE = 32
+
+# Column order of the auction CSV
+_CSV_COLUMNS = ['sale_date', 'brand', 'model', 'year', 'price', 'mileage', 'kvd_id', 'url']
+
+# In-page extraction script for the browser fallback: returns the sold
+# flags and the raw price/mileage/year texts in a single IPC round-trip
+_EXTRACT_FIELDS_JS = """
+const text = document.body.innerText;
+let price = null, mileage = null;
+for (const span of document.querySelectorAll('span')) {
+    const t = span.innerText;
+    if (price === null && / kr/.test(t)) price = t;
+    if (mileage === null && /( mil| km)/.test(t)) mileage = t;
+    if (price !== null && mileage !== null) break;
+}
+const yearEl = document.querySelector(
+    '.Summary__SpecLabels-sc-f1qdrz-4 > span:nth-child(1) > span:nth-child(1)');
+return {
+    sold: text.includes('Såld'),
+    reservation: text.includes('Reservationspris uppnått'),
+    fixedPrice: text.includes('Bilen köptes via fast pris'),
+    price: price,
+    mileage: mileage,
+    year: yearEl ? yearEl.innerText : null
+};
+"""
+
+_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    )
+}
 
 
 class KVDScraper:
@@ -29,8 +129,9 @@ class KVDScraper:
         self.csv_filename = "src/scraper/kvd_auctions.csv"
         self.auctions_data = []
         self.processed_ids = set()
+        self._pending_cars = []
         self.async_session = sessionmaker(engine, class_=sql_asyncio.AsyncSession)
-        self.car_service = CarService()
+        self.car_repository = CarRepository()
         
         # Use existing logger from logging module
         self.logger = logging.getLogger(__name__)
@@ -42,7 +143,14 @@ class KVDScraper:
         
         # Load existing data
         self.load_existing_data()
-        
+
+        # The CSV append handle is opened lazily on the first saved
+        # auction (see _ensure_csv_writer); opening it here would touch
+        # the file on mere instantiation and leak the handle if the
+        # browser launch below fails
+        self._csv_fh = None
+        self._csv_writer = None
+
         # Configure Chrome
         chrome_options = Options()
         chrome_options.add_argument('--headless')
@@ -52,7 +160,9 @@ class KVDScraper:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument('--pageLoadStrategy=normal')
+        # Return from driver.get as soon as the DOM is interactive; the
+        # explicit waits cover the late-rendered elements we actually need
+        chrome_options.page_load_strategy = "eager"
         chrome_prefs = {
             "profile.default_content_setting_values.notifications": 2,
             "profile.managed_default_content_settings.images": 2,
@@ -61,15 +171,29 @@ class KVDScraper:
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.set_page_load_timeout(30)
-        self.driver.implicitly_wait(10)
+
+        # Block images and analytics/tracker scripts at the network layer;
+        # they dominate page-load time and are never read by the parser
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+                "*googletagmanager*", "*google-analytics*",
+                "*doubleclick*", "*facebook.net*",
+            ]})
+        except Exception as e:
+            self.logger.warning(f"Could not set up CDP network blocking: {e}")
 
     def load_existing_data(self) -> None:
-        """Load existing auction data from CSV if available"""
+        """Load existing auction IDs from CSV if available.
+
+        Only the kvd_id column is needed for deduplication, so skip
+        materializing the historical rows entirely.
+        """
         try:
             if os.path.exists(self.csv_filename):
-                df = pd.read_csv(self.csv_filename)
-                self.auctions_data = df.to_dict('records')
-                self.processed_ids = set(df['kvd_id'].astype(str))
+                df = pd.read_csv(self.csv_filename, usecols=['kvd_id'], dtype={'kvd_id': str})
+                self.processed_ids = set(df['kvd_id'])
                 self.logger.info(f"Loaded {len(self.processed_ids)} existing auction records from CSV")
             else:
                 self.logger.info("No existing auction data found in CSV")
@@ -83,57 +207,29 @@ class KVDScraper:
         Extract the brand and full model name from kvd_id.
         The first part becomes brand (lowercased).
         Everything between the first and last part (excluding the number at the end) becomes the model.
-        
+
         Example:
         "tesla-model-3-performance-awd-245870" would give:
         brand = "tesla"
         model = "model-3 performance awd"
         """
-        # Parse kvd_id to extract brand and full model name
-        parts = kvd_id.split('-')
-        
-        # Handle edge cases
-        if not parts:
-            return "unknown", "unknown"
-            
-        # First part is the brand
-        brand = parts[0].lower()
-        
-        # Check if the last part is numeric - if so, exclude it
-        last_part_index = -1
-        if parts and parts[-1].isdigit():
-            last_part_index = -2  # Exclude the last element (number)
-        else:
-            last_part_index = -1  # Include everything if the last part isn't numeric
-        
-        # Everything in between first and last part is the model
-        # Convert hyphens to spaces in the model name
-        model_parts = parts[1:last_part_index+1]
-        model = " ".join(model_parts)
-        
-        return brand, model
+        return _parse_brand_model(kvd_id)
 
     def should_skip_auction(self, kvd_id: str) -> bool:
         """Check if an auction should be skipped based on ID prefixes"""
-        skip_prefixes = [
-            "vinterhjul",
-            "losa-hjul",
-            "nokian-hakkapeliitta",
-        ]
-        return any(kvd_id.lower().startswith(prefix) for prefix in skip_prefixes)
+        return _SKIP_RE.match(kvd_id) is not None
 
     def is_sold(self, page_source: str, kvd_id: str) -> bool:
         """Check if the vehicle is sold by looking for both 'Såld' and 'Reservationspris uppnått'."""
-        
-        soup = BeautifulSoup(page_source, "html.parser")
 
-        # Extract text once for faster checking
-        page_text = soup.get_text()
+        # Check the raw page source directly - only substring presence is
+        # needed, so building a parse tree would be wasted work
+        if isinstance(page_source, bytes):
+            page_source = page_source.decode("utf-8", "ignore")
 
-        # Check for both 'Såld' and 'Reservationspris uppnått' in the page text
-        sold_detected = "Såld" in page_text
-        reservation_detected = "Reservationspris uppnått" in page_text
-        fixed_price_detected = "Bilen köptes via fast pris" in page_text
+        sold_detected = _SOLD_TOKEN in page_source
+        reservation_detected = _RESERVATION_TOKEN in page_source
+        fixed_price_detected = _FIXED_PRICE_TOKEN in page_source
 
         if sold_detected and reservation_detected:
             self.logger.info(f"Auction {kvd_id} is SOLD by auction (Detected both 'Såld' and 'Reservationspris uppnått')")
@@ -181,24 +277,35 @@ class KVDScraper:
                 self.logger.warning(f"Could not handle language popup: {e2}")
 
     def get_auction_links(self) -> List[Dict[str, str]]:
-        """Get links to closed auctions from the current page"""
+        """Get links to closed auctions from the current page.
+
+        Waits for the listing rows, then parses them all out of a single
+        page_source snapshot; per-row find_element calls would each be a
+        separate chromedriver round-trip.
+        """
         links = []
         try:
-            time.sleep(2)
-            rows = WebDriverWait(self.driver, 10).until(
+            WebDriverWait(self.driver, 10).until(
                 EC.presence_of_all_elements_located(
                     (By.CSS_SELECTOR, ".App__ContentContainer-sc-1p21c8x-1 > ul > table > tbody > tr")
                 )
             )
-            
-            for row in rows:
+
+            tree = LexborHTMLParser(self.driver.page_source)
+            for row in tree.css(".App__ContentContainer-sc-1p21c8x-1 > ul > table > tbody > tr"):
                 try:
-                    link_elem = row.find_element(By.CSS_SELECTOR, "td:nth-child(2) a")
-                    title = link_elem.text.strip()
-                    link = link_elem.get_attribute("href")
-                    
-                    date_text = row.find_element(By.CSS_SELECTOR, "td:nth-child(3)").text.strip()
-                    if date_text and ' ' in date_text:
+                    link_elem = row.css_first("td:nth-child(2) a")
+                    date_cell = row.css_first("td:nth-child(3)")
+                    if link_elem is None or date_cell is None:
+                        continue
+
+                    title = link_elem.text().strip()
+                    link = link_elem.attributes.get("href")
+                    if link and link.startswith('/'):
+                        link = f"{self.base_url}{link}"
+
+                    date_text = date_cell.text().strip()
+                    if link and date_text and ' ' in date_text:
                         date_only = date_text.split(' ')[0]
                         links.append({
                             'url': link,
@@ -207,14 +314,14 @@ class KVDScraper:
                         })
                     else:
                         self.logger.warning(f"Invalid date format for auction: {title}")
-                        
+
                 except Exception as e:
                     self.logger.error(f"Error extracting row data: {str(e)}")
                     continue
-                    
+
         except Exception as e:
             self.logger.error(f"Error getting auction links: {str(e)}")
-            
+
         return links
 
     def parse_auction_details(self, auction_url: str, auction_date: str) -> Optional[Dict[str, Any]]:
@@ -233,21 +340,26 @@ class KVDScraper:
 
             # Load the auction page
             self.driver.get(auction_url)
-            # Wait longer for dynamic content to load, especially the sold badge
-            time.sleep(3)
-            
-            # Wait explicitly for price element
+
+            # Wait explicitly for the elements we actually read instead of
+            # a blanket sleep; the price span is the last to render
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, 8).until(
                     EC.presence_of_element_located((By.XPATH, "//span[contains(text(),' kr')]"))
                 )
+                WebDriverWait(self.driver, 8).until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//span[contains(text(),' mil') or contains(text(),' km')]"))
+                )
             except:
                 self.logger.info(f"No price found for {kvd_id} after waiting, may not be sold")
                 
-            page_source = self.driver.page_source
-            
-            # Check if the auction is sold
-            if not self.is_sold(page_source, kvd_id):
+            # Pull just the fields we need with one in-page script instead
+            # of serializing the whole DOM back through page_source
+            data = self.driver.execute_script(_EXTRACT_FIELDS_JS)
+
+            sold = data.get('sold') and (data.get('reservation') or data.get('fixedPrice'))
+            if not sold:
                 self.logger.info(f"Skipping unsold auction {kvd_id}")
                 return None
 
@@ -263,48 +375,25 @@ class KVDScraper:
                 'year': None
             }
 
-            # Extract mileage
-            try:
-                mileage_text = self.driver.find_element(By.XPATH, "//span[contains(text(),' mil') or contains(text(),' km')]").text
-                mileage_match = re.search(r'(\d[\d\s]*)\s*(mil|km)', mileage_text.lower())
-
+            if data.get('mileage'):
+                mileage_match = _MILEAGE_RE.search(data['mileage'].lower())
                 if mileage_match:
-                    mileage_value = int(mileage_match.group(1).replace(" ", ""))
-                    mileage_unit = mileage_match.group(2)
-
-                    if mileage_unit == "mil":
+                    mileage_value = int(_NON_DIGIT_RE.sub("", mileage_match.group(1)))
+                    if mileage_match.group(2) == "mil":
                         details['mileage'] = mileage_value
-                    elif mileage_unit == "km":
+                    else:
                         details['mileage'] = mileage_value // 10  # Convert km to mil
 
-                else:
-                    self.logger.warning(f"No mileage found in element text: {mileage_text}")
-                    details['mileage'] = None
-
-            except Exception as e:
-                self.logger.error(f"Error extracting mileage: {e}")
-                details['mileage'] = None
-
-            # Extract price
-            try:
-                price_text = self.driver.find_element(By.XPATH, "//span[contains(text(),' kr')]").text
-                details['price'] = int(price_text.replace(" kr", "").replace(" ", ""))
-            except Exception as e:
-                self.logger.error(f"Could not extract price for {auction_url}: {e}")
-                details['price'] = None
+            if data.get('price'):
+                details['price'] = int(_NON_DIGIT_RE.sub("", data['price']))
+            else:
+                self.logger.error(f"Could not extract price for {auction_url}")
 
-            # Extract year
-            try:
-                year_element = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    ".Summary__SpecLabels-sc-f1qdrz-4 > span:nth-child(1) > span:nth-child(1)"
-                )
-                year_text = year_element.text.strip()
-                details['year'] = int(year_text)
-                self.logger.info(f"Extracted year directly: {details['year']}")
-            except Exception as e:
-                self.logger.warning(f"Error extracting year via direct selector: {e}")
-                details['year'] = None
+            if data.get('year'):
+                try:
+                    details['year'] = int(data['year'].strip())
+                except ValueError:
+                    self.logger.warning(f"Could not parse year for {kvd_id}: {data['year']}")
 
             return details
 
@@ -312,67 +401,183 @@ class KVDScraper:
             self.logger.error(f"Error parsing auction details for {auction_url}: {e}")
             return None
 
+    async def fetch_auction_page(self, http_session: aiohttp.ClientSession, auction_url: str) -> str:
+        """Fetch an auction page over plain HTTP (no browser render)"""
+        async with http_session.get(auction_url) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    def parse_auction_html(self, page_source: str, auction_url: str, auction_date: str) -> Optional[Dict[str, Any]]:
+        """Parse auction details from raw page HTML.
+
+        Same extraction logic as parse_auction_details, but working on a
+        fetched HTML string so it can run off the browser entirely.
+        """
+        kvd_id = auction_url.split('/')[-1]
+
+        if not self.is_sold(page_source, kvd_id):
+            self.logger.info(f"Skipping unsold auction {kvd_id}")
+            return None
+
+        brand, model = self.get_brand_model(kvd_id)
+        details = {
+            'kvd_id': kvd_id,
+            'url': auction_url,
+            'sale_date': auction_date,
+            'brand': brand,
+            'model': model,
+            'mileage': None,
+            'price': None,
+            'year': None
+        }
+
+        mileage_match = _MILEAGE_HTML_RE.search(page_source)
+        if mileage_match:
+            mileage_value = int(_NON_DIGIT_RE.sub("", mileage_match.group(1)))
+            if mileage_match.group(2) == "mil":
+                details['mileage'] = mileage_value
+            else:
+                details['mileage'] = mileage_value // 10  # Convert km to mil
+        else:
+            self.logger.warning(f"No mileage found in page for {kvd_id}")
+
+        price_match = _PRICE_HTML_RE.search(page_source)
+        if price_match:
+            details['price'] = int(_NON_DIGIT_RE.sub("", price_match.group(1)))
+        else:
+            self.logger.error(f"Could not extract price for {auction_url}")
+
+        year_match = _YEAR_HTML_RE.search(page_source)
+        if year_match:
+            details['year'] = int(year_match.group(1))
+        else:
+            self.logger.warning(f"Could not extract year for {kvd_id}")
+
+        return details
+
+    async def parse_auction_details_async(
+        self, http_session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+        link_data: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one auction, bounded by the shared semaphore"""
+        async with semaphore:
+            page_source = await self.fetch_auction_page(http_session, link_data['url'])
+        return self.parse_auction_html(page_source, link_data['url'], link_data['date'])
+
+    def _ensure_csv_writer(self) -> csv.DictWriter:
+        """Open the CSV append handle on first use.
+
+        Saved auctions are appended row by row instead of rewriting the
+        whole file every time; deferring the open keeps instantiation
+        side-effect free.
+        """
+        if self._csv_writer is None:
+            write_header = not os.path.exists(self.csv_filename) or os.path.getsize(self.csv_filename) == 0
+            self._csv_fh = open(self.csv_filename, "a", newline="", encoding="utf-8")
+            self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=_CSV_COLUMNS, extrasaction="ignore")
+            if write_header:
+                self._csv_writer.writeheader()
+                self._csv_fh.flush()
+        return self._csv_writer
+
     async def save_auction(self, details: Dict[str, Any], db_session) -> None:
         """Save auction details to database and CSV"""
         try:
-            # Check if car already exists in DB
-            exists = await self.car_service.check_if_car_exists(db_session, details['kvd_id'])
-            if exists:
-                self.logger.info(f"Car with kvd_id {details['kvd_id']} already exists in DB, skipping insertion.")
+            # The processed set already holds every id from the CSV and the
+            # database (loaded once at startup), so an existence SELECT per
+            # auction is redundant; the unique constraint on kvd_id remains
+            # the last-resort guard
+            if details['kvd_id'] in self.processed_ids:
+                self.logger.info(f"Car with kvd_id {details['kvd_id']} already exists, skipping insertion.")
                 return
-                
-            # Create car object from details
-            from src.api.schemas import CarCreate
-            
-            # Ensure mileage and year have valid default values
-            mileage = details.get('mileage')
-            if mileage is None:
-                mileage = 0
-                
-            year = details.get('year')
-            if year is None:
-                year = 0
-                
-            car_data = CarCreate(
-                kvd_id=details['kvd_id'],
-                brand=details['brand'],
-                model=details['model'],
-                year=year,
-                price=details.get('price'),
-                mileage=mileage,
-                sale_date=datetime.strptime(details['sale_date'], '%Y-%m-%d').date(),
-                url=details['url'],
-                raw_data=details  # Store the original data
-            )
-            
-            # Save to database using service
-            await self.car_service.create_car(db_session, car_data)
-            
-            # Update local CSV data
-            self.auctions_data.append(details)
-            self.save_to_csv()
+            self.processed_ids.add(details['kvd_id'])
+
+
+            # Buffer a plain row dict; the fields come straight from our
+            # own parser, so a pydantic validation round-trip per row is
+            # skipped on this hot path
+            self._pending_cars.append({
+                'kvd_id': details['kvd_id'],
+                'brand': details['brand'],
+                'model': details['model'],
+                'year': details.get('year') or 0,
+                'price': details.get('price'),
+                'mileage': details.get('mileage') or 0,
+                'sale_date': datetime.strptime(details['sale_date'], '%Y-%m-%d').date(),
+                'url': details['url'],
+                'raw_data': details  # Store the original data
+            })
+            if len(self._pending_cars) >= _INSERT_BATCH_SIZE:
+                await self.flush_pending_cars(db_session)
 
         except Exception as e:
             self.logger.error(f"Error saving auction {details.get('kvd_id')}: {e}")
 
+    async def flush_pending_cars(self, db_session) -> None:
+        """Write all buffered auction rows to the database in one batch.
+
+        The CSV rows and the processed ids only become durable once the
+        batch lands in the database: future runs seed processed_ids from
+        the CSV, so recording a failed batch there would silently drop
+        those auctions forever. On failure the ids are released again and
+        nothing is written, leaving the batch retryable on the next run.
+        """
+        if not self._pending_cars:
+            return
+        batch, self._pending_cars = self._pending_cars, []
+        try:
+            # Straight to the repository: the upsert skips duplicate
+            # kvd_ids at the database level in the same statement
+            count = await self.car_repository.bulk_upsert(db_session, batch)
+            self.logger.info(f"Flushed {count} auctions to the database")
+        except Exception as e:
+            self.logger.error(f"Error bulk-inserting auctions: {e}")
+            for row in batch:
+                self.processed_ids.discard(row['kvd_id'])
+            return
+
+        # Append the new rows to the CSV instead of rewriting the file
+        writer = self._ensure_csv_writer()
+        for row in batch:
+            details = row['raw_data']
+            self.auctions_data.append(details)
+            writer.writerow({key: details.get(key) for key in _CSV_COLUMNS})
+        self._csv_fh.flush()
+
     def save_to_csv(self) -> None:
-        """Save auction data to CSV file"""
+        """One-shot full rewrite of the CSV file (deduplication/repair only;
+        the hot path appends rows via the open writer instead).
+
+        auctions_data only holds this run's rows, so the historical file
+        is re-read and merged before rewriting; otherwise a repair would
+        truncate the CSV to the current run.
+        """
         try:
+            # Let pending appends land before re-reading the file
+            if self._csv_fh is not None:
+                self._csv_fh.flush()
             df = pd.DataFrame(self.auctions_data)
-            columns = ['sale_date', 'brand', 'model', 'year', 'price', 'mileage', 'kvd_id', 'url']
-            df = df.reindex(columns=columns)
+            if os.path.exists(self.csv_filename):
+                existing = pd.read_csv(self.csv_filename)
+                df = pd.concat([existing, df], ignore_index=True)
+            df = df.reindex(columns=_CSV_COLUMNS)
+            df = df.drop_duplicates(subset=['kvd_id'], keep='last')
             df.to_csv(self.csv_filename, index=False)
             self.logger.info(f"Data saved to {self.csv_filename}, total records: {len(df)}")
         except Exception as e:
             self.logger.error(f"Error saving to CSV: {e}")
 
     async def load_kvd_ids_from_db(self) -> Set[str]:
-        """Load all existing KVD IDs from the database"""
+        """Load all existing KVD IDs from the database.
+
+        Streams the single column in server-side batches instead of
+        materializing a Row object per car.
+        """
         async with self.async_session() as db_session:
-            result = await db_session.execute(select(Car.kvd_id))
-            rows = result.all()
-            existing_ids = {row[0] for row in rows}
-            return existing_ids
+            result = await db_session.stream_scalars(
+                select(Car.kvd_id).execution_options(yield_per=10000)
+            )
+            return {kvd_id async for kvd_id in result}
 
     async def run(self) -> None:
         """Run the scraper to collect auction data"""
@@ -390,14 +595,19 @@ class KVDScraper:
 
             # Load existing IDs from database
             db_ids = await self.load_kvd_ids_from_db()
-            self.processed_ids |= db_ids
+            # Build the combined set in one allocation sized for both
+            # sources, instead of growing the CSV set element by element
+            self.processed_ids = self.processed_ids.union(db_ids)
             self.logger.info(f"Loaded {len(db_ids)} existing records from DB. "
                         f"Combined processed set has {len(self.processed_ids)} items.")
             
             page = 1
             new_auctions = 0
 
-            async with self.async_session() as db_session:
+            semaphore = asyncio.Semaphore(_DETAIL_FETCH_CONCURRENCY)
+            connector = aiohttp.TCPConnector(limit=_DETAIL_FETCH_CONCURRENCY)
+            async with self.async_session() as db_session, \
+                    aiohttp.ClientSession(headers=_HTTP_HEADERS, connector=connector) as http_session:
                 while True:
                     self.logger.info(f"Processing page {page}")
                     auction_links = self.get_auction_links()
@@ -406,14 +616,38 @@ class KVDScraper:
                         self.logger.info("No more auctions found")
                         break
 
-                    for link_data in auction_links:
-                        kvd_id = link_data['url'].split('/')[-1]
-                        if kvd_id not in self.processed_ids:
+                    # Filter out already-seen and skip-prefixed auctions in
+                    # one pass before any fetch happens
+                    pending = [
+                        link_data for link_data in auction_links
+                        if (kvd_id := link_data['url'].split('/')[-1]) not in self.processed_ids
+                        and not self.should_skip_auction(kvd_id)
+                    ]
+
+                    # Fetch all new auctions on this page concurrently
+                    results = await asyncio.gather(
+                        *(self.parse_auction_details_async(http_session, semaphore, link_data)
+                          for link_data in pending),
+                        return_exceptions=True,
+                    )
+
+                    for link_data, details in zip(pending, results):
+                        if isinstance(details, Exception):
+                            # Fall back to the browser for pages the plain
+                            # HTTP fetch could not handle
+                            self.logger.warning(
+                                f"HTTP fetch failed for {link_data['url']}: {details}, "
+                                f"falling back to browser")
                             details = self.parse_auction_details(link_data['url'], link_data['date'])
-                            if details:
-                                await self.save_auction(details, db_session)
-                                self.processed_ids.add(details['kvd_id'])
-                                new_auctions += 1
+                        if details:
+                            # save_auction records the id itself; adding it
+                            # here too would undo the release a failed
+                            # flush performs for its batch
+                            await self.save_auction(details, db_session)
+                            new_auctions += 1
+
+                    # Flush whatever is buffered once per listing page
+                    await self.flush_pending_cars(db_session)
 
                     # Try to go to next page
                     try:
@@ -430,9 +664,37 @@ class KVDScraper:
         except Exception as e:
             self.logger.error(f"Error in main scraping routine: {e}")
         finally:
+            if self._csv_fh is not None:
+                self._csv_fh.flush()
+
+    def reset_state(self) -> None:
+        """Prepare the scraper for another run while keeping the browser alive.
+
+        Clears the per-run buffers and re-reads the seen ids from the CSV;
+        run() reloads the database ids itself.
+        """
+        self.auctions_data = []
+        self._pending_cars = []
+        self.load_existing_data()
+
+    def close(self) -> None:
+        """Release the browser and the CSV file handle"""
+        try:
+            if self._csv_fh is not None:
+                self._csv_fh.close()
+                self._csv_fh = None
+                self._csv_writer = None
+        except Exception as e:
+            self.logger.warning(f"Error closing CSV file: {e}")
+        try:
             self.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error quitting driver: {e}")
 
 
 if __name__ == "__main__":
     scraper = KVDScraper()
-    asyncio.run(scraper.run())
\ No newline at end of file
+    try:
+        asyncio.run(scraper.run())
+    finally:
+        scraper.close()
\ No newline at end of file
@@ -1,5 +1,13 @@
 import asyncio
+import atexit
 import logging
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # uvloop is Linux-only and optional; the stdlib loop works everywhere
+    uvloop = None
 from datetime import datetime, timedelta
 import time
 import os
@@ -17,22 +25,26 @@ async def run_scheduled(schedule_type="hourly"):
     Args:
         schedule_type: Type of schedule ("hourly", "daily", "midnight", "immediately", "hourly_immediate")
     """
+    # One scraper (and one Chrome process) for the whole service lifetime;
+    # each iteration only resets its per-run state
+    scraper = KVDScraper()
+    atexit.register(scraper.close)
+
     # Start with an immediate run if using hourly_immediate schedule
     if schedule_type == "hourly_immediate":
         try:
             logger.info("Starting immediate scrape on initialization")
-            scraper = KVDScraper()
             await scraper.run()
             logger.info("Completed immediate scrape")
         except Exception as e:
             logger.error(f"Error in immediate scrape: {e}")
-    
+
     while True:
         try:
             # Run the scraper first if not hourly_immediate (since we already ran it above)
             if schedule_type != "hourly_immediate":
                 logger.info("Starting scheduled scrape")
-                scraper = KVDScraper()
+                scraper.reset_state()
                 await scraper.run()
                 logger.info("Completed scheduled scrape")
             
@@ -79,14 +91,16 @@ async def run_scheduled(schedule_type="hourly"):
 
 async def run_once():
     """Run the scraper once and exit"""
+    scraper = KVDScraper()
     try:
         logger.info("Starting one-time scrape")
-        scraper = KVDScraper()
         await scraper.run()
         logger.info("Completed one-time scrape")
     except Exception as e:
         logger.error(f"Error in one-time scrape: {e}")
         raise
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":
@@ -27,10 +27,26 @@ class CarService:
             min_mileage=min_mileage, max_mileage=max_mileage
         )
     
+    async def get_cars_serialized(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100,
+        brand: Optional[str] = None, model: Optional[str] = None,
+        year: Optional[int] = None, min_price: Optional[int] = None,
+        max_price: Optional[int] = None, min_mileage: Optional[int] = None,
+        max_mileage: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.repository.get_filtered_rows(
+            db, skip=skip, limit=limit, brand=brand, model=model,
+            year=year, min_price=min_price, max_price=max_price,
+            min_mileage=min_mileage, max_mileage=max_mileage
+        )
+
     async def create_car(self, db: AsyncSession, car_data: CarCreate) -> Any:
         car_dict = car_data.model_dump()
         return await self.repository.create(db, obj_in=car_dict)
     
+    async def bulk_create_cars(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        return await self.repository.bulk_create(db, rows)
+
     async def update_car(self, db: AsyncSession, car_id: int, car_data: CarUpdate) -> Optional[Any]:
         car = await self.repository.get(db, car_id)
         if not car:
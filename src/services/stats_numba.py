@@ -0,0 +1,46 @@
+"""Numba-accelerated numeric helpers for auction statistics.
+
+These helpers operate on plain numpy arrays so they can be JIT-compiled
+once (cached to disk via ``cache=True``) and then run as machine code
+with the GIL released. Callers are expected to convert query results to
+arrays before handing them over.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to the pure-Python implementation
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def regression_slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute the least-squares regression slope of y over x.
+
+    Uses the closed-form formula so the whole computation is a single
+    pass over the arrays. Returns 0.0 for degenerate inputs (fewer than
+    two points or zero variance in x).
+    """
+    n = x.shape[0]
+    if n < 2:
+        return 0.0
+
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    sum_xx = 0.0
+    for i in range(n):
+        sum_x += x[i]
+        sum_y += y[i]
+        sum_xy += x[i] * y[i]
+        sum_xx += x[i] * x[i]
+
+    denominator = n * sum_xx - sum_x * sum_x
+    if denominator == 0.0:
+        return 0.0
+
+    return (n * sum_xy - sum_x * sum_y) / denominator
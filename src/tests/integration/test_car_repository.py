@@ -1,20 +1,22 @@
 """Integration tests for the car repository with a real test database."""
 import pytest
 from datetime import date
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 
-from src.repositories.car import CarRepository
 from src.models.car import Car
 from src.api.schemas import CarCreate, CarUpdate
 
+# Validates a whole batch in one pass instead of per-instance CarCreate(...)
+_CARS_ADAPTER = TypeAdapter(list[CarCreate])
+
 
-@pytest.mark.asyncio
 class TestCarRepository:
     """Integration tests for CarRepository with real database interactions."""
 
-    async def test_create_and_get_car(self, db_session):
+    async def test_create_and_get_car(self, db_session, car_repository):
         """Test creating a car and retrieving it."""
         # Arrange
-        repository = CarRepository()
         car_data = CarCreate(
             kvd_id="test-integration-1",
             brand="IntegrationBrand",
@@ -27,10 +29,10 @@ class TestCarRepository:
         )
         
         # Act - Create car
-        created_car = await repository.create(db_session, car_data)
+        created_car = await car_repository.create(db_session, car_data)
         
         # Get the car by ID
-        retrieved_car = await repository.get(db_session, created_car.id)
+        retrieved_car = await car_repository.get(db_session, created_car.id)
         
         # Assert
         assert retrieved_car is not None
@@ -44,10 +46,9 @@ class TestCarRepository:
         assert retrieved_car.sale_date == car_data.sale_date
         assert retrieved_car.url == car_data.url
 
-    async def test_update_car(self, db_session):
+    async def test_update_car(self, db_session, car_repository):
         """Test updating a car's information."""
         # Arrange
-        repository = CarRepository()
         car_data = CarCreate(
             kvd_id="test-integration-2",
             brand="OldBrand",
@@ -60,7 +61,7 @@ class TestCarRepository:
         )
         
         # Create initial car
-        created_car = await repository.create(db_session, car_data)
+        created_car = await car_repository.create(db_session, car_data)
         
         # Update data
         update_data = CarUpdate(
@@ -70,7 +71,7 @@ class TestCarRepository:
         )
         
         # Act
-        updated_car = await repository.update(db_session, created_car.id, update_data)
+        updated_car = await car_repository.update(db_session, created_car.id, update_data)
         
         # Assert
         assert updated_car is not None
@@ -81,10 +82,9 @@ class TestCarRepository:
         assert updated_car.price == update_data.price  # Changed
         assert updated_car.mileage == update_data.mileage  # Changed
 
-    async def test_delete_car(self, db_session):
+    async def test_delete_car(self, db_session, car_repository):
         """Test deleting a car from the database."""
         # Arrange
-        repository = CarRepository()
         car_data = CarCreate(
             kvd_id="test-integration-3",
             brand="DeleteBrand",
@@ -97,74 +97,67 @@ class TestCarRepository:
         )
         
         # Create initial car
-        created_car = await repository.create(db_session, car_data)
+        created_car = await car_repository.create(db_session, car_data)
         
         # Verify it exists
-        car_exists = await repository.exists(db_session, created_car.id)
+        car_exists = await car_repository.exists(db_session, created_car.id)
         assert car_exists is True
         
         # Act - Delete the car
-        delete_result = await repository.delete(db_session, created_car.id)
+        delete_result = await car_repository.delete(db_session, created_car.id)
         
         # Assert
         assert delete_result is True
         
         # Verify it no longer exists
-        car_exists = await repository.exists(db_session, created_car.id)
+        car_exists = await car_repository.exists(db_session, created_car.id)
         assert car_exists is False
         
         # Try to get the deleted car
-        deleted_car = await repository.get(db_session, created_car.id)
+        deleted_car = await car_repository.get(db_session, created_car.id)
         assert deleted_car is None
 
-    async def test_get_multiple_cars(self, db_session):
+    async def test_get_multiple_cars(self, db_session, car_repository):
         """Test retrieving multiple cars with filters and pagination."""
         # Arrange
-        repository = CarRepository()
-        
-        # Create test cars with different brands
-        test_cars = [
-            CarCreate(
-                kvd_id=f"test-multi-{i}",
-                brand="TestBrand" if i % 2 == 0 else "OtherBrand",
-                model=f"Model{i}",
-                year=2020 + i,
-                price=100000 + i * 10000,
-                mileage=i * 1000,
-                sale_date=date(2025, 1, 20 + i),
-                url=f"https://example.com/multi-{i}"
-            ) for i in range(5)
-        ]
         
-        created_cars = []
-        for car_data in test_cars:
-            car = await repository.create(db_session, car_data)
-            created_cars.append(car)
-            
+        # Create test cars with different brands, validated as one batch
+        test_cars = _CARS_ADAPTER.validate_python([
+            {
+                "kvd_id": f"test-multi-{i}",
+                "brand": "TestBrand" if i % 2 == 0 else "OtherBrand",
+                "model": f"Model{i}",
+                "year": 2020 + i,
+                "price": 100000 + i * 10000,
+                "mileage": i * 1000,
+                "sale_date": date(2025, 1, 20 + i),
+                "url": f"https://example.com/multi-{i}",
+            } for i in range(5)
+        ])
+        
+        # Seed all rows with a single bulk INSERT and one commit
+        await db_session.execute(insert(Car), [car.model_dump() for car in test_cars])
+        await db_session.commit()
+        created_cars = test_cars
+
+
         # Act - Get all cars
-        all_cars, total = await repository.get_multi(db_session)
-        
-        # Assert
-        assert len(all_cars) >= len(created_cars)  # May include cars from other tests
-        assert total >= len(created_cars)
-        
+        all_cars = await car_repository.get_multi(db_session)
+
+        # Assert - the savepoint fixture guarantees an otherwise-empty table
+        assert len(all_cars) == len(created_cars)
+
         # Act - Get cars with pagination
-        paginated_cars, paginated_total = await repository.get_multi(
-            db_session, skip=1, limit=2
-        )
-        
+        paginated_cars = await car_repository.get_multi(db_session, skip=1, limit=2)
+
         # Assert
         assert len(paginated_cars) == 2
-        assert paginated_total >= len(created_cars)
-        
+
         # Act - Get cars with brand filter
-        filtered_cars, filtered_total = await repository.get_multi(
-            db_session, brand="TestBrand"
-        )
-        
-        # Assert - At least our test cars with TestBrand should be included
+        filtered_cars = await car_repository.get_filtered(db_session, brand="TestBrand")
+
+        # Assert - exactly our TestBrand cars should come back
         test_brand_count = sum(1 for car in test_cars if car.brand == "TestBrand")
-        assert len(filtered_cars) >= test_brand_count
-        assert filtered_total >= test_brand_count
+        assert len(filtered_cars) == test_brand_count
         for car in filtered_cars:
             assert car.brand == "TestBrand"
\ No newline at end of file
@@ -1,91 +1,66 @@
 """Unit tests for the car service module."""
 import pytest
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from src.services.car_service import CarService
 from src.models.car import Car
 from src.api.schemas import CarCreate, CarUpdate
 
 
-@pytest.mark.asyncio
 class TestCarService:
     """Test cases for CarService class."""
 
-    async def test_get_car(self):
+    async def test_get_car(self, car_service, fake_session):
         """Test retrieving a single car by ID."""
         # Arrange
-        session = AsyncMock()
         car_id = 1
-        mock_car = Car(id=car_id, kvd_id="test-car-1", brand="TestBrand", model="TestModel", 
-                    year=2020, price=100000, mileage=10000, 
+        mock_car = Car(id=car_id, kvd_id="test-car-1", brand="TestBrand", model="TestModel",
+                    year=2020, price=100000, mileage=10000,
                     sale_date=date(2025, 1, 1), url="https://example.com/test-car-1")
-        
-        session.execute.return_value = AsyncMock()
-        session.execute.return_value.scalar_one_or_none = AsyncMock(return_value=mock_car)
+        fake_session.queue_result(mock_car)
 
-        service = CarService()
-        
         # Act
-        result = await service.get_car(session, car_id)
-        
+        result = await car_service.get_car(fake_session, car_id)
+
         # Assert
         assert result == mock_car
-        session.execute.assert_called_once()
+        assert len(fake_session.executed) == 1
 
-    async def test_get_car_not_found(self):
+    async def test_get_car_not_found(self, car_service, fake_session):
         """Test retrieving a non-existent car returns None."""
         # Arrange
-        session = AsyncMock()
         car_id = 999  # Non-existent ID
-        
-        # Configure the execute method to return None
-        session.execute.return_value.scalar_one_or_none.return_value = None
-        service = CarService()
-        
+        fake_session.queue_result(None)
+
         # Act
-        result = await service.get_car(session, car_id)
-        
+        result = await car_service.get_car(fake_session, car_id)
+
         # Assert
         assert result is None
-        session.execute.assert_called_once()
+        assert len(fake_session.executed) == 1
 
-    async def test_get_cars(self):
+    async def test_get_cars(self, car_service, fake_session):
         """Test retrieving multiple cars with pagination."""
         # Arrange
-        session = AsyncMock()
         mock_cars = [
-            Car(id=1, kvd_id="test-car-1", brand="Brand1", model="Model1", 
-                year=2020, price=100000, mileage=10000, 
+            Car(id=1, kvd_id="test-car-1", brand="Brand1", model="Model1",
+                year=2020, price=100000, mileage=10000,
                 sale_date=date(2025, 1, 1), url="https://example.com/1"),
-            Car(id=2, kvd_id="test-car-2", brand="Brand2", model="Model2", 
-                year=2021, price=150000, mileage=5000, 
+            Car(id=2, kvd_id="test-car-2", brand="Brand2", model="Model2",
+                year=2021, price=150000, mileage=5000,
                 sale_date=date(2025, 1, 2), url="https://example.com/2")
         ]
+        fake_session.queue_result(mock_cars)
 
-        session.execute.return_value = AsyncMock()
-        session.execute.return_value.scalars = AsyncMock()
-        session.execute.return_value.scalars.return_value.all = AsyncMock(return_value=mock_cars)
-
-        # Total count for pagination
-        session.execute.return_value.scalar = AsyncMock(return_value=len(mock_cars))
-
-        service = CarService()
-        
         # Act
-        result, total = await service.get_cars(session, skip=0, limit=10)
-        
+        result = await car_service.get_cars(fake_session, skip=0, limit=10)
+
         # Assert
         assert result == mock_cars
-        assert total == len(mock_cars)
-        assert session.execute.call_count == 2  # One for results, one for count
+        assert len(fake_session.executed) == 1
 
-    async def test_create_car(self):
+    async def test_create_car(self, car_service, fake_session):
         """Test creating a new car."""
         # Arrange
-        session = AsyncMock()
         car_data = CarCreate(
             kvd_id="new-car-1",
             brand="NewBrand",
@@ -96,12 +71,10 @@ class TestCarService:
             sale_date=date(2025, 1, 10),
             url="https://example.com/new-car-1"
         )
-        
-        service = CarService()
-        
+
         # Act
-        result = await service.create_car(session, car_data)
-        
+        result = await car_service.create_car(fake_session, car_data)
+
         # Assert
         assert result.kvd_id == car_data.kvd_id
         assert result.brand == car_data.brand
@@ -111,15 +84,14 @@ class TestCarService:
         assert result.mileage == car_data.mileage
         assert result.sale_date == car_data.sale_date
         assert result.url == car_data.url
-        
-        session.add.assert_called_once()
-        session.commit.assert_called_once()
-        session.refresh.assert_called_once()
 
-    async def test_update_car(self):
+        assert fake_session.added == [result]
+        assert fake_session.commits == 1
+        assert fake_session.refreshed == [result]
+
+    async def test_update_car(self, car_service, fake_session):
         """Test updating an existing car."""
         # Arrange
-        session = AsyncMock()
         car_id = 1
         mock_car = Car(
             id=car_id,
@@ -132,35 +104,41 @@ class TestCarService:
             sale_date=date(2025, 1, 1),
             url="https://example.com/test-car-1"
         )
-        
-        # Configure the execute method to return our mock car
-        session.execute.return_value = AsyncMock()
-        session.execute.return_value.scalar_one_or_none = AsyncMock(return_value=mock_car)
+        fake_session.queue_result(mock_car)
 
-        
         update_data = CarUpdate(
             brand="NewBrand",
             price=120000
         )
-        
-        service = CarService()
-        
+
         # Act
-        result = await service.update_car(session, car_id, update_data)
-        
+        result = await car_service.update_car(fake_session, car_id, update_data)
+
         # Assert
         assert result.id == car_id
         assert result.brand == update_data.brand  # Updated field
-        assert result.model == mock_car.model  # Unchanged field
+        assert result.model == "OldModel"  # Unchanged field
         assert result.price == update_data.price  # Updated field
-        
-        session.execute.assert_called_once()
-        session.commit.assert_called_once()
 
-    async def test_delete_car(self):
+        assert len(fake_session.executed) == 1
+        assert fake_session.commits == 1
+
+    async def test_update_car_not_found(self, car_service, fake_session):
+        """Test updating a non-existent car returns None."""
+        # Arrange
+        car_id = 999  # Non-existent ID
+        fake_session.queue_result(None)
+
+        # Act
+        result = await car_service.update_car(fake_session, car_id, CarUpdate(price=1))
+
+        # Assert
+        assert result is None
+        assert fake_session.commits == 0
+
+    async def test_delete_car(self, car_service, fake_session):
         """Test deleting a car."""
         # Arrange
-        session = AsyncMock()
         car_id = 1
         mock_car = Car(
             id=car_id,
@@ -173,65 +151,58 @@ class TestCarService:
             sale_date=date(2025, 1, 1),
             url="https://example.com/test-car-1"
         )
-        
-        # Configure the execute method to return our mock car
-        session.execute.return_value.scalar_one_or_none.return_value = mock_car
-        
-        service = CarService()
-        
+        fake_session.queue_result(mock_car)
+
         # Act
-        result = await service.delete_car(session, car_id)
-        
+        result = await car_service.delete_car(fake_session, car_id)
+
         # Assert
-        assert result is True
-        session.execute.assert_called_once()
-        session.delete.assert_called_once_with(mock_car)
-        session.commit.assert_called_once()
+        assert result is mock_car
+        assert len(fake_session.executed) == 1
+        assert fake_session.deleted == [mock_car]
+        assert fake_session.commits == 1
 
-    async def test_delete_car_not_found(self):
+    async def test_delete_car_not_found(self, car_service, fake_session):
         """Test attempting to delete a non-existent car."""
         # Arrange
-        session = AsyncMock()
         car_id = 999  # Non-existent ID
-        
-        # Configure the execute method to return None
-        session.execute.return_value.scalar_one_or_none.return_value = None
-        
-        service = CarService()
-        
+        fake_session.queue_result(None)
+
         # Act
-        result = await service.delete_car(session, car_id)
-        
+        result = await car_service.delete_car(fake_session, car_id)
+
         # Assert
-        assert result is False
-        session.execute.assert_called_once()
-        session.delete.assert_not_called()
-        session.commit.assert_not_called()
+        assert result is None
+        assert len(fake_session.executed) == 1
+        assert fake_session.deleted == []
+        assert fake_session.commits == 0
 
-    async def test_check_if_car_exists(self):
+    async def test_check_if_car_exists(self, car_service, fake_session):
         """Test checking if a car exists by KVD ID."""
         # Arrange
-        session = AsyncMock()
         kvd_id = "test-car-1"
-        
+        mock_car = Car(
+            id=1, kvd_id=kvd_id, brand="TestBrand", model="TestModel",
+            year=2020, price=100000, mileage=10000,
+            sale_date=date(2025, 1, 1), url="https://example.com/test-car-1"
+        )
+
         # Test case 1: Car exists
-        session.execute.return_value.scalar.return_value = 1
-        service = CarService()
-        
+        fake_session.queue_result(mock_car)
+
         # Act
-        result = await service.check_if_car_exists(session, kvd_id)
-        
+        result = await car_service.check_if_car_exists(fake_session, kvd_id)
+
         # Assert
         assert result is True
-        session.execute.assert_called_once()
-        
+        assert len(fake_session.executed) == 1
+
         # Test case 2: Car does not exist
-        session.reset_mock()
-        session.execute.return_value.scalar.return_value = 0
-        
+        fake_session.queue_result(None)
+
         # Act
-        result = await service.check_if_car_exists(session, kvd_id)
-        
+        result = await car_service.check_if_car_exists(fake_session, kvd_id)
+
         # Assert
         assert result is False
-        session.execute.assert_called_once()
\ No newline at end of file
+        assert len(fake_session.executed) == 2
@@ -1,52 +1,73 @@
 from pydantic_settings import BaseSettings
 from typing import Optional, List
+from functools import cached_property, lru_cache
+import atexit
 import os
-import json
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
-import logging.config
+
+try:
+    # orjson parses in C with zero-copy strings; fall back to stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Log destination, fixed once at import so repeated setup calls never
+# re-run datetime formatting or path construction
+_LOG_PATH = f"logs/app_{datetime.now():%Y%m%d}.log"
+_LOGGING_INITIALIZED = False
 
 
 def setup_logging():
-    """Set up logging configuration for the entire application"""
-    # Ensure logs directory exists
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-        
-    # Configure logging
-    logging_config = {
-        'version': 1,
-        'disable_existing_loggers': False,
-        'formatters': {
-            'standard': {
-                'format': '%(asctime)s - %(levelname)s - %(message)s'
-            },
-        },
-        'handlers': {
-            'console': {
-                'level': 'INFO',
-                'class': 'logging.StreamHandler',
-                'formatter': 'standard'
-            },
-            'file': {
-                'level': 'INFO',
-                'class': 'logging.FileHandler',
-                'filename': f"{log_dir}/app_{datetime.now().strftime('%Y%m%d')}.log",
-                'formatter': 'standard'
-            }
-        },
-        'loggers': {
-            '': {  # Root logger
-                'handlers': ['console', 'file'],
-                'level': 'INFO',
-                'propagate': True
-            }
-        }
-    }
-    
-    # Apply configuration
-    logging.config.dictConfig(logging_config)
+    """Set up logging configuration for the entire application.
+
+    Log records are funneled through an in-memory queue so that the
+    caller (often an asyncio event loop) only pays for an enqueue; a
+    background listener thread does the actual console and file writes.
+    """
+    # Idempotent: re-imports (e.g. under pytest) must not re-attach
+    # handlers and double the log volume
+    global _LOGGING_INITIALIZED
+    root = logging.getLogger()
+    if _LOGGING_INITIALIZED or root.handlers:
+        return
+    _LOGGING_INITIALIZED = True
+
+    # Ensure logs directory exists (single syscall, race-free)
+    os.makedirs("logs", exist_ok=True)
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        _LOG_PATH,
+        maxBytes=10_000_000,
+        backupCount=5,
+    )
+    file_handler.setFormatter(formatter)
+
+    # The root logger only enqueues; the listener thread owns the
+    # blocking console/file I/O
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # SQL echo output (DB_ECHO=true) must take the same queued path:
+    # keep sqlalchemy.engine free of direct handlers so its records
+    # propagate to the root QueueHandler and the listener thread does
+    # the formatting and disk writes, never the event loop
+    logging.getLogger("sqlalchemy.engine").handlers.clear()
 
 class Settings(BaseSettings):
     # Database
@@ -55,6 +76,9 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "postgres"
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "kvd_auctions"
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
     
     # Redis
     REDIS_HOST: str = "redis"
@@ -64,6 +88,7 @@ class Settings(BaseSettings):
     # API
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "KVD Auction Tracker"
+    DEBUG: bool = False
     
     # Security
     SECRET_KEY: str = "change_me_in_production"
@@ -76,14 +101,20 @@ class Settings(BaseSettings):
     SCRAPER_SCHEDULE: str = "0 0 * * *"  # Run at midnight
     SCRAPER_RATE_LIMIT: int = 1  # Seconds between requests
     
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
-    
-    @property
+
+    @cached_property
     def REDIS_URL(self) -> str:
         return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
 
+    def model_post_init(self, __context) -> None:
+        # Warm both URL caches at construction so every later read is a
+        # plain instance-dict lookup, never a descriptor call
+        self.DATABASE_URL
+        self.REDIS_URL
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -92,14 +123,25 @@ class Settings(BaseSettings):
         def parse_env_var(cls, field_name: str, raw_val: str) -> any:
             if field_name == "BACKEND_CORS_ORIGINS" and raw_val:
                 try:
-                    return json.loads(raw_val)
-                except json.JSONDecodeError:
+                    return _json_loads(raw_val)
+                except ValueError:
                     # If not a JSON array, treat as comma-separated string
                     return [origin.strip() for origin in raw_val.split(",")]
             return raw_val
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, constructed once per process.
+
+    Settings construction re-reads the environment and `.env` file, so
+    callers (and FastAPI dependencies) should go through this cached
+    accessor instead of instantiating Settings directly.
+    """
+    return Settings()
+
+
 # Initialize the settings
-settings = Settings()
+settings = get_settings()
 
 # Set up logging on module import
 setup_logging()
\ No newline at end of file
@@ -1,13 +1,68 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from src.models import Base
 from src.utils.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+def make_engine(url: str = None, **kwargs):
+    """Build an async engine with the application's standard tuning.
+
+    SQL echo is opt-in via DB_ECHO: formatting and logging every
+    statement is pure overhead (and a credential-leak hazard) in
+    production. The pool is sized explicitly so warm connections are
+    reused across requests instead of paying a fresh TCP handshake;
+    pre-ping weeds out stale connections and recycle caps their
+    lifetime below common server/firewall idle timeouts.
+
+    Tests pass their own URL and overrides (e.g. poolclass=NullPool,
+    which takes no sizing arguments) so app and test engines share one
+    construction path.
+    """
+    options = {"echo": settings.DB_ECHO}
+    if "poolclass" not in kwargs:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+    options.update(kwargs)
+    return create_async_engine(url or settings.DATABASE_URL, **options)
+
+
+engine = make_engine()
+
+# Factory for all sessions: request-scoped ones from get_db as well as
+# callers that need their own short-lived sessions, e.g. to run
+# independent queries concurrently (sessions are not concurrency-safe).
+# expire_on_commit=False keeps ORM objects readable after commit without
+# a refresh SELECT; autoflush is off since the repositories flush
+# explicitly via commit.
+async_session_factory = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False
+)
 
 async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Probe without opening a transaction: on the common warm-boot path
+    # the single catalog lookup is all that runs, with no BEGIN/COMMIT
+    # round-trips. Only a missing schema upgrades to a real transaction.
+    async with engine.connect() as conn:
+        exists = await conn.scalar(text("SELECT to_regclass('public.cars')"))
+        if exists is None:
+            async with conn.begin():
+                await conn.run_sync(Base.metadata.create_all)
 
 async def get_db() -> AsyncSession:
-    async with AsyncSession(engine) as session:
-        yield session
\ No newline at end of file
+    async with async_session_factory() as session:
+        yield session
+
+async def run_parallel(*coros):
+    """Run independent database coroutines concurrently.
+
+    Each coroutine must use its own session (AsyncSession is not safe
+    for concurrent use) - pair this with async_session_factory. Lets
+    callers overlap independent reads instead of awaiting them one by
+    one, which keeps the pooled connections busy in parallel.
+    """
+    return await asyncio.gather(*coros)
\ No newline at end of file